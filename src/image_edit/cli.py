@@ -1,11 +1,11 @@
 """CLI interface for image-edit."""
 
+import contextlib
 from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from . import __version__
 from .config import (
@@ -18,7 +18,6 @@ from .config import (
     CONFIG_KEYS,
     DEFAULTS,
 )
-from .core import run_edit, run_generate, run_combine, get_provider
 from .providers import ProviderError
 from .templates import get_registry
 from .utils import read_image_input, read_multiple_images, write_image_output
@@ -33,6 +32,13 @@ app = typer.Typer(
 console = Console(stderr=True)
 
 
+def _status(message: str) -> contextlib.AbstractContextManager:
+    """Show a spinner on interactive terminals; do nothing when piped/redirected."""
+    if console.is_terminal:
+        return console.status(message)
+    return contextlib.nullcontext()
+
+
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
@@ -106,9 +112,11 @@ def edit(
         cat photo.png | image-edit "watercolor style" > art.png
         image-edit remove-bg -i portrait.jpg -o nobg.png
     """
+    from .core import run_edit
+
     try:
         # Read input
-        with console.status("[bold blue]Reading image..."):
+        with _status("[bold blue]Reading image..."):
             image_data, detected_format = read_image_input(input_file)
 
         mime_type = detected_format.mime_type if detected_format else None
@@ -122,7 +130,7 @@ def edit(
                 raise typer.Exit(1)
 
         # Perform edit
-        with console.status(f"[bold blue]Editing with {provider}..."):
+        with _status(f"[bold blue]Editing with {provider}..."):
             result = run_edit(image_data, prompt, provider, mime_type)
 
         # Write output
@@ -177,6 +185,8 @@ def generate(
         image-edit generate "a sunset over mountains" -o sunset.png
         image-edit generate "abstract art" > art.png
     """
+    from .core import run_generate
+
     try:
         # Parse output format
         fmt: Optional[ImageFormat] = None
@@ -187,7 +197,7 @@ def generate(
                 raise typer.Exit(1)
 
         # Generate image
-        with console.status(f"[bold blue]Generating with {provider}..."):
+        with _status(f"[bold blue]Generating with {provider}..."):
             result = run_generate(prompt, provider)
 
         # Write output
@@ -253,9 +263,11 @@ def combine(
         image-edit combine "create a panorama" -i left.jpg -i center.jpg -i right.jpg -o panorama.png
         cat background.png | image-edit combine "overlay the logo" -i logo.png -o final.png
     """
+    from .core import run_combine
+
     try:
         # Read input images
-        with console.status("[bold blue]Reading images..."):
+        with _status("[bold blue]Reading images..."):
             images_with_format = read_multiple_images(list(input_files))
 
         # Validate minimum 2 images
@@ -281,7 +293,7 @@ def combine(
                 raise typer.Exit(1)
 
         # Perform combine
-        with console.status(f"[bold blue]Combining {len(images)} images with {provider}..."):
+        with _status(f"[bold blue]Combining {len(images)} images with {provider}..."):
             result = run_combine(images, prompt, provider)
 
         # Write output
@@ -301,8 +313,10 @@ def combine(
 @app.command()
 def templates() -> None:
     """List available editing templates."""
+    from rich.table import Table
+
     registry = get_registry()
-    all_templates = registry.list_all()
+    all_templates = registry.iter_all()
 
     table = Table(title="Available Templates")
     table.add_column("Name", style="cyan", no_wrap=True)
@@ -319,6 +333,10 @@ def templates() -> None:
 @app.command()
 def providers() -> None:
     """Show available providers and their status."""
+    from rich.table import Table
+
+    from .core import get_provider
+
     settings = get_settings()
 
     table = Table(title="Providers")
@@ -436,6 +454,8 @@ def config_show() -> None:
 
     Displays effective values from config file, environment, and defaults.
     """
+    from rich.table import Table
+
     table = Table(title="Configuration")
     table.add_column("Key", style="cyan", no_wrap=True)
     table.add_column("Value", style="green")
@@ -1,29 +1,39 @@
 """Configuration management for image-edit CLI."""
 
+import functools
 import os
+import sys
 from pathlib import Path
 from typing import Any, Optional
 
-try:
+if sys.version_info >= (3, 11):
     import tomllib
-except ImportError:
+else:
     import tomli as tomllib
 
 import tomli_w
 
 
+@functools.cache
 def get_config_dir() -> Path:
-    """Get the configuration directory path."""
+    """Get the configuration directory path (created on first call)."""
     config_dir = Path.home() / ".config" / "image-edit"
     config_dir.mkdir(parents=True, exist_ok=True)
     return config_dir
 
 
+@functools.cache
 def get_config_file() -> Path:
     """Get the configuration file path."""
     return get_config_dir() / "config.toml"
 
 
+def _reset_paths() -> None:
+    """Clear cached config paths (e.g. after $HOME changes in tests)."""
+    get_config_dir.cache_clear()
+    get_config_file.cache_clear()
+
+
 # Valid configuration keys and their descriptions
 CONFIG_KEYS = {
     "api-key": "Gemini API key for authentication",
@@ -40,24 +50,68 @@ DEFAULTS = {
 }
 
 
+# Parsed config file contents, reused until the file's stat signature changes
+_CONFIG_CACHE: Optional[dict[str, Any]] = None
+_CONFIG_STAT: Optional[tuple[int, int, int]] = None
+
+
+def _stat_signature(path: Path) -> tuple[int, int, int]:
+    """Return (mtime_ns, size, inode) used to detect config file changes."""
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
 def _load_config_file() -> dict[str, Any]:
-    """Load configuration from the TOML file."""
+    """Load configuration from the TOML file (cached until the file changes)."""
+    global _CONFIG_CACHE, _CONFIG_STAT
     config_file = get_config_file()
-    if not config_file.exists():
+    try:
+        signature = _stat_signature(config_file)
+    except OSError:
+        _CONFIG_CACHE, _CONFIG_STAT = {}, None
         return {}
 
+    if _CONFIG_CACHE is not None and signature == _CONFIG_STAT:
+        return _CONFIG_CACHE
+
     try:
         with open(config_file, "rb") as f:
-            return tomllib.load(f)
+            config = tomllib.load(f)
     except Exception:
-        return {}
+        config = {}
+
+    _CONFIG_CACHE, _CONFIG_STAT = config, signature
+    return config
 
 
 def _save_config_file(config: dict[str, Any]) -> None:
-    """Save configuration to the TOML file."""
+    """Save configuration to the TOML file atomically (write temp file, then replace)."""
+    global _CONFIG_CACHE, _CONFIG_STAT
     config_file = get_config_file()
-    with open(config_file, "wb") as f:
-        tomli_w.dump(config, f)
+    # Replace the symlink target, not the link, and keep the file's permissions
+    # (it may hold the API key); new files are private to the user
+    target = config_file.resolve()
+    try:
+        mode = target.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o600
+
+    tmp_file = target.with_name(target.name + ".tmp")
+    tmp_file.unlink(missing_ok=True)
+    try:
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        fd = os.open(tmp_file, flags, mode)
+        with open(fd, "wb") as f:
+            tomli_w.dump(config, f)
+            f.flush()
+            os.fsync(f.fileno())
+        # os.open's mode is filtered by the umask; apply it exactly
+        os.chmod(tmp_file, mode)
+        os.replace(tmp_file, target)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    _CONFIG_CACHE, _CONFIG_STAT = config, _stat_signature(config_file)
 
 
 def get_config_value(key: str) -> Optional[str]:
@@ -112,9 +166,10 @@ def set_config_value(key: str, value: str) -> None:
         valid_keys = ", ".join(CONFIG_KEYS.keys())
         raise ValueError(f"Unknown configuration key '{key}'. Valid keys: {valid_keys}")
 
-    config = _load_config_file()
+    config = dict(_load_config_file())
     config[key] = value
     _save_config_file(config)
+    reload_settings()
 
 
 def unset_config_value(key: str) -> bool:
@@ -127,10 +182,11 @@ def unset_config_value(key: str) -> bool:
     Returns:
         True if the key was removed, False if it wasn't set
     """
-    config = _load_config_file()
+    config = dict(_load_config_file())
     if key in config:
         del config[key]
         _save_config_file(config)
+        reload_settings()
         return True
     return False
 
@@ -147,29 +203,36 @@ def get_all_config() -> dict[str, Optional[str]]:
 
 def get_config_file_values() -> dict[str, Any]:
     """Get only the values stored in the config file."""
-    return _load_config_file()
+    return dict(_load_config_file())
 
 
 # Convenience accessors for common settings
 class Settings:
-    """Convenience class for accessing settings."""
+    """
+    Convenience class for accessing settings.
+
+    Values other than the API key are resolved once per instance; use
+    reload_settings() to pick up changes made outside
+    set_config_value/unset_config_value. The API key is always looked up
+    fresh so a missing key can be supplied later in the same process.
+    """
 
     @property
     def gemini_api_key(self) -> Optional[str]:
         """Get the Gemini API key."""
         return get_config_value("api-key")
 
-    @property
+    @functools.cached_property
     def gemini_model(self) -> str:
         """Get the Gemini model name."""
         return get_config_value("model") or DEFAULTS["model"]
 
-    @property
+    @functools.cached_property
     def default_format(self) -> str:
         """Get the default output format."""
         return get_config_value("default-format") or DEFAULTS["default-format"]
 
-    @property
+    @functools.cached_property
     def default_quality(self) -> str:
         """Get the default quality setting."""
         return get_config_value("default-quality") or DEFAULTS["default-quality"]
@@ -1,17 +1,33 @@
 """Core orchestration logic for image editing operations."""
 
 import asyncio
-from typing import Optional
+import functools
+from typing import Callable, Optional
 
-from .providers import GeminiProvider, Provider, ProviderError
+from .providers import Provider, ProviderError
 from .providers.base import EditResult
 from .templates import get_registry
 
 
+def _gemini_provider() -> Provider:
+    """Construct a GeminiProvider, importing the Gemini SDK on first use."""
+    from .providers.gemini import GeminiProvider
+
+    return GeminiProvider()
+
+
+# Provider name -> factory
+_PROVIDERS: dict[str, Callable[[], Provider]] = {
+    "gemini": _gemini_provider,
+}
+
+
 def get_provider(name: str = "gemini") -> Provider:
     """
     Get a provider instance by name.
 
+    Instances are cached per process so the underlying API client is reused.
+
     Args:
         name: Provider name (currently only "gemini" supported)
 
@@ -21,15 +37,25 @@ def get_provider(name: str = "gemini") -> Provider:
     Raises:
         ValueError: If provider name is unknown
     """
-    providers = {
-        "gemini": GeminiProvider,
-    }
+    # Cache on the resolved name so get_provider() and get_provider("gemini")
+    # share one instance
+    return _get_provider(name)
+
 
-    if name not in providers:
-        available = ", ".join(providers.keys())
+@functools.lru_cache(maxsize=None)
+def _get_provider(name: str) -> Provider:
+    """Construct (once per name) the provider registered under name."""
+    factory = _PROVIDERS.get(name)
+    if factory is None:
+        available = ", ".join(_PROVIDERS.keys())
         raise ValueError(f"Unknown provider '{name}'. Available: {available}")
 
-    return providers[name]()
+    return factory()
+
+
+def reset_provider_cache() -> None:
+    """Discard cached provider instances (mainly for tests)."""
+    _get_provider.cache_clear()
 
 
 def resolve_prompt(prompt_or_template: str) -> str:
@@ -51,7 +77,7 @@ def resolve_prompt(prompt_or_template: str) -> str:
     return prompt_or_template
 
 
-async def edit_image(
+def run_edit(
     image_data: bytes,
     prompt: str,
     provider_name: str = "gemini",
@@ -75,10 +101,10 @@ async def edit_image(
     provider = get_provider(provider_name)
     resolved_prompt = resolve_prompt(prompt)
 
-    return await provider.edit(image_data, resolved_prompt, mime_type)
+    return provider.edit(image_data, resolved_prompt, mime_type)
 
 
-async def generate_image(
+def run_generate(
     prompt: str,
     provider_name: str = "gemini",
 ) -> EditResult:
@@ -96,48 +122,10 @@ async def generate_image(
         ProviderError: If generation fails
     """
     provider = get_provider(provider_name)
-    return await provider.generate(prompt)
-
-
-def run_edit(
-    image_data: bytes,
-    prompt: str,
-    provider_name: str = "gemini",
-    mime_type: Optional[str] = None,
-) -> EditResult:
-    """
-    Synchronous wrapper for edit_image.
-
-    Args:
-        image_data: Raw image bytes
-        prompt: Edit instruction
-        provider_name: Name of the provider to use
-        mime_type: MIME type of the input image
-
-    Returns:
-        EditResult with the edited image
-    """
-    return asyncio.run(edit_image(image_data, prompt, provider_name, mime_type))
-
-
-def run_generate(
-    prompt: str,
-    provider_name: str = "gemini",
-) -> EditResult:
-    """
-    Synchronous wrapper for generate_image.
-
-    Args:
-        prompt: Text description of the image to generate
-        provider_name: Name of the provider to use
-
-    Returns:
-        EditResult with the generated image
-    """
-    return asyncio.run(generate_image(prompt, provider_name))
+    return provider.generate(prompt)
 
 
-async def combine_images(
+def run_combine(
     images: list[tuple[bytes, Optional[str]]],
     prompt: str,
     provider_name: str = "gemini",
@@ -160,23 +148,31 @@ async def combine_images(
     if len(images) < 2:
         raise ValueError("At least 2 images are required for combine operation")
     provider = get_provider(provider_name)
-    return await provider.combine(images, prompt)
+    return provider.combine(images, prompt)
 
 
-def run_combine(
-    images: list[tuple[bytes, Optional[str]]],
+async def edit_image(
+    image_data: bytes,
     prompt: str,
     provider_name: str = "gemini",
+    mime_type: Optional[str] = None,
 ) -> EditResult:
-    """
-    Synchronous wrapper for combine_images.
+    """Async wrapper for run_edit; runs the blocking call in a worker thread."""
+    return await asyncio.to_thread(run_edit, image_data, prompt, provider_name, mime_type)
 
-    Args:
-        images: List of (image_data, mime_type) tuples
-        prompt: Text description of how to combine the images
-        provider_name: Name of the provider to use
 
-    Returns:
-        EditResult with the combined image
-    """
-    return asyncio.run(combine_images(images, prompt, provider_name))
+async def generate_image(
+    prompt: str,
+    provider_name: str = "gemini",
+) -> EditResult:
+    """Async wrapper for run_generate; runs the blocking call in a worker thread."""
+    return await asyncio.to_thread(run_generate, prompt, provider_name)
+
+
+async def combine_images(
+    images: list[tuple[bytes, Optional[str]]],
+    prompt: str,
+    provider_name: str = "gemini",
+) -> EditResult:
+    """Async wrapper for run_combine; runs the blocking call in a worker thread."""
+    return await asyncio.to_thread(run_combine, images, prompt, provider_name)
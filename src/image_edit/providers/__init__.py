@@ -1,10 +1,23 @@
 """Image editing providers."""
 
+from typing import TYPE_CHECKING, Any
+
 from .base import Provider, ProviderError
-from .gemini import GeminiProvider
+
+if TYPE_CHECKING:
+    from .gemini import GeminiProvider
 
 __all__ = [
     "Provider",
     "ProviderError",
     "GeminiProvider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import provider implementations on first access (they pull in heavy SDKs)."""
+    if name == "GeminiProvider":
+        from .gemini import GeminiProvider
+
+        return GeminiProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -37,7 +37,7 @@ class Provider(ABC):
         pass
 
     @abstractmethod
-    async def edit(
+    def edit(
         self,
         image_data: bytes,
         prompt: str,
@@ -60,7 +60,7 @@ class Provider(ABC):
         pass
 
     @abstractmethod
-    async def generate(
+    def generate(
         self,
         prompt: str,
     ) -> EditResult:
@@ -79,7 +79,7 @@ class Provider(ABC):
         pass
 
     @abstractmethod
-    async def combine(
+    def combine(
         self,
         images: list[tuple[bytes, Optional[str]]],
         prompt: str,
@@ -1,22 +1,30 @@
 """Gemini provider for image editing using Google's Gemini API."""
 
-import base64
+import functools
 from typing import Optional
 
 from google import genai
 from google.genai import types
 
 from ..config import get_settings
-from ..utils.image import detect_format, ImageFormat
+from ..utils.image import detect_format
 from .base import Provider, ProviderError, EditResult
 
 
+@functools.lru_cache(maxsize=32)
+def _mime_from_header(header: bytes) -> str:
+    """Map an image header (first 12 bytes) to a MIME type, defaulting to PNG."""
+    fmt = detect_format(header)
+    return fmt.mime_type if fmt else "image/png"
+
+
 class GeminiProvider(Provider):
     """Image editing provider using Google's Gemini API."""
 
     def __init__(self) -> None:
         """Initialize the Gemini provider."""
         self._client: Optional[genai.Client] = None
+        self._client_key: Optional[str] = None
 
     @property
     def name(self) -> str:
@@ -34,18 +42,19 @@ class GeminiProvider(Provider):
         return get_settings().has_gemini_key
 
     def _get_client(self) -> genai.Client:
-        """Get or create the Gemini client."""
-        if self._client is None:
-            settings = get_settings()
-            if not settings.gemini_api_key:
-                raise ProviderError(
-                    "Gemini API key not configured. "
-                    "Run 'image-edit config set api-key YOUR_KEY' or set GEMINI_API_KEY."
-                )
-            self._client = genai.Client(api_key=settings.gemini_api_key)
+        """Get or create the Gemini client, rebuilding it if the API key changed."""
+        api_key = get_settings().gemini_api_key
+        if not api_key:
+            raise ProviderError(
+                "Gemini API key not configured. "
+                "Run 'image-edit config set api-key YOUR_KEY' or set GEMINI_API_KEY."
+            )
+        if self._client is None or api_key != self._client_key:
+            self._client = genai.Client(api_key=api_key)
+            self._client_key = api_key
         return self._client
 
-    async def edit(
+    def edit(
         self,
         image_data: bytes,
         prompt: str,
@@ -66,11 +75,7 @@ class GeminiProvider(Provider):
 
         # Detect format if not provided
         if mime_type is None:
-            fmt = detect_format(image_data)
-            mime_type = fmt.mime_type if fmt else "image/png"
-
-        # Encode image as base64
-        image_b64 = base64.standard_b64encode(image_data).decode("utf-8")
+            mime_type = _mime_from_header(image_data[:12])
 
         try:
             response = client.models.generate_content(
@@ -117,7 +122,7 @@ class GeminiProvider(Provider):
                 raise
             raise ProviderError(f"Gemini API error: {e}") from e
 
-    async def generate(
+    def generate(
         self,
         prompt: str,
     ) -> EditResult:
@@ -158,7 +163,7 @@ class GeminiProvider(Provider):
                 raise
             raise ProviderError(f"Gemini API error: {e}") from e
 
-    async def combine(
+    def combine(
         self,
         images: list[tuple[bytes, Optional[str]]],
         prompt: str,
@@ -176,13 +181,13 @@ class GeminiProvider(Provider):
         client = self._get_client()
 
         # Build parts list with all images followed by prompt
-        parts = []
-        for image_data, mime_type in images:
-            if mime_type is None:
-                fmt = detect_format(image_data)
-                mime_type = fmt.mime_type if fmt else "image/png"
-            parts.append(types.Part.from_bytes(data=image_data, mime_type=mime_type))
-
+        parts = [
+            types.Part.from_bytes(
+                data=image_data,
+                mime_type=mime_type or _mime_from_header(image_data[:12]),
+            )
+            for image_data, mime_type in images
+        ]
         parts.append(types.Part.from_text(text=prompt))
 
         try:
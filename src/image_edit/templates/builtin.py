@@ -2,7 +2,7 @@
 
 from .registry import Template
 
-BUILTIN_TEMPLATES = [
+BUILTIN_TEMPLATES = (
     Template(
         name="remove-bg",
         prompt=(
@@ -105,4 +105,4 @@ BUILTIN_TEMPLATES = [
         description="Apply watercolor painting effect",
         aliases=["painting", "artistic"],
     ),
-]
+)
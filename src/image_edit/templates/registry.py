@@ -1,18 +1,20 @@
 """Template registry for managing editing templates."""
 
+import sys
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-try:
+if sys.version_info >= (3, 11):
     import tomllib
-except ImportError:
+else:
     import tomli as tomllib
 
 from ..config import get_config_dir
 
 
-@dataclass
+@dataclass(slots=True)
 class Template:
     """A predefined image editing template."""
 
@@ -33,18 +35,42 @@ class TemplateRegistry:
     def __init__(self) -> None:
         """Initialize the registry."""
         self._templates: dict[str, Template] = {}
-        self._alias_map: dict[str, str] = {}
+        # Flat name/alias -> template map so get() is a single dict lookup
+        self._lookup: dict[str, Template] = {}
+        self._frozen = False
+        # Snapshot of _templates.values(), rebuilt after register()
+        self._list_cache: Optional[tuple[Template, ...]] = None
 
     def register(self, template: Template) -> None:
         """
         Register a template.
 
+        A template with the same name replaces the existing one, including
+        for aliases that pointed at it. Primary names take precedence over
+        aliases.
+
         Args:
             template: The template to register
+
+        Raises:
+            RuntimeError: If the registry has been frozen
         """
+        if self._frozen:
+            raise RuntimeError("Cannot register templates on a frozen registry")
+
+        previous = self._templates.get(template.name)
         self._templates[template.name] = template
-        for alias in template.aliases:
-            self._alias_map[alias] = template.name
+        self._list_cache = None
+        if previous is not None:
+            for key, value in self._lookup.items():
+                if value is previous:
+                    self._lookup[key] = template
+
+        self._lookup.update(dict.fromkeys(template.aliases, template))
+        # Restore primary names shadowed by one of the new aliases
+        for name in self._templates.keys() & set(template.aliases):
+            self._lookup[name] = self._templates[name]
+        self._lookup[template.name] = template
 
     def get(self, name: str) -> Optional[Template]:
         """
@@ -56,19 +82,25 @@ class TemplateRegistry:
         Returns:
             The template if found, None otherwise
         """
-        # Check direct name first
-        if name in self._templates:
-            return self._templates[name]
+        return self._lookup.get(name)
 
-        # Check aliases
-        if name in self._alias_map:
-            return self._templates[self._alias_map[name]]
+    def freeze(self) -> None:
+        """Mark the registry read-only; further register() calls will fail."""
+        self._frozen = True
 
-        return None
+    def __contains__(self, name: object) -> bool:
+        """Check whether a name or alias refers to a registered template."""
+        return name in self._lookup
+
+    def iter_all(self) -> tuple[Template, ...]:
+        """Return all registered templates as a cached, immutable tuple."""
+        if self._list_cache is None:
+            self._list_cache = tuple(self._templates.values())
+        return self._list_cache
 
     def list_all(self) -> list[Template]:
         """Return all registered templates."""
-        return list(self._templates.values())
+        return list(self.iter_all())
 
     def load_user_templates(self) -> None:
         """Load user-defined templates from config directory."""
@@ -81,37 +113,63 @@ class TemplateRegistry:
         try:
             with open(templates_file, "rb") as f:
                 data = tomllib.load(f)
+        except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError):
+            # Silently ignore unreadable or malformed user templates
+            return
 
-            for tmpl_data in data.get("template", []):
-                template = Template(
-                    name=tmpl_data["name"],
-                    prompt=tmpl_data["prompt"],
-                    description=tmpl_data.get("description", ""),
-                    aliases=tmpl_data.get("aliases", []),
-                )
-                self.register(template)
-        except Exception:
-            # Silently ignore malformed user templates
-            pass
-
+        templates_list = data.get("template", [])
+        if not isinstance(templates_list, list):
+            return
 
-# Global registry instance
-_registry: Optional[TemplateRegistry] = None
+        for tmpl_data in templates_list:
+            # Skip entries that are missing required fields or have the wrong shape
+            if not isinstance(tmpl_data, dict):
+                continue
+            name = tmpl_data.get("name")
+            prompt = tmpl_data.get("prompt")
+            description = tmpl_data.get("description", "")
+            aliases = tmpl_data.get("aliases", [])
+            if not (
+                isinstance(name, str)
+                and isinstance(prompt, str)
+                and isinstance(description, str)
+                and isinstance(aliases, list)
+                and all(isinstance(alias, str) for alias in aliases)
+            ):
+                continue
+
+            self.register(
+                Template(
+                    name=name,
+                    prompt=prompt,
+                    description=description,
+                    aliases=aliases,
+                )
+            )
 
 
-def get_registry() -> TemplateRegistry:
-    """Get the global template registry, initializing if needed."""
-    global _registry
-    if _registry is None:
-        _registry = TemplateRegistry()
+# Global registry, with built-in templates registered at import time.
+# Imported here rather than at the top because builtin.py imports Template.
+from .builtin import BUILTIN_TEMPLATES  # noqa: E402
 
-        # Register built-in templates
-        from .builtin import BUILTIN_TEMPLATES
+_registry = TemplateRegistry()
+for _template in BUILTIN_TEMPLATES:
+    _registry.register(_template)
+del _template
 
-        for template in BUILTIN_TEMPLATES:
-            _registry.register(template)
+_user_loaded = False
+_user_load_lock = threading.Lock()
 
-        # Load user templates (these can override built-ins)
-        _registry.load_user_templates()
 
+def get_registry() -> TemplateRegistry:
+    """Get the global template registry, loading user templates on first call."""
+    global _user_loaded
+    if not _user_loaded:
+        with _user_load_lock:
+            # Re-check: another thread may have loaded while we waited
+            if not _user_loaded:
+                # User templates can override built-ins
+                _registry.load_user_templates()
+                _registry.freeze()
+                _user_loaded = True
     return _registry
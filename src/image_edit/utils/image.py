@@ -15,23 +15,37 @@ class ImageFormat(str, Enum):
     @property
     def mime_type(self) -> str:
         """Get the MIME type for this format."""
-        return f"image/{self.value}"
+        return _MIME[self]
 
     @property
     def extension(self) -> str:
         """Get the file extension for this format."""
-        if self == ImageFormat.JPEG:
-            return ".jpg"
-        return f".{self.value}"
-
-
-# Magic bytes for image format detection
-MAGIC_BYTES = {
-    b"\x89PNG\r\n\x1a\n": ImageFormat.PNG,
-    b"\xff\xd8\xff": ImageFormat.JPEG,
-    b"RIFF": ImageFormat.WEBP,  # WebP starts with RIFF
-    b"GIF87a": ImageFormat.GIF,
-    b"GIF89a": ImageFormat.GIF,
+        return _EXT[self]
+
+
+# Precomputed per-format MIME types and file extensions
+_MIME: dict[ImageFormat, str] = {
+    ImageFormat.PNG: "image/png",
+    ImageFormat.JPEG: "image/jpeg",
+    ImageFormat.WEBP: "image/webp",
+    ImageFormat.GIF: "image/gif",
+}
+
+_EXT: dict[ImageFormat, str] = {
+    ImageFormat.PNG: ".png",
+    ImageFormat.JPEG: ".jpg",
+    ImageFormat.WEBP: ".webp",
+    ImageFormat.GIF: ".gif",
+}
+
+
+# File extension (without dot, lowercase) -> format
+_EXT_MAP: dict[str, ImageFormat] = {
+    "png": ImageFormat.PNG,
+    "jpg": ImageFormat.JPEG,
+    "jpeg": ImageFormat.JPEG,
+    "webp": ImageFormat.WEBP,
+    "gif": ImageFormat.GIF,
 }
 
 
@@ -48,21 +62,23 @@ def detect_format(data: bytes) -> Optional[ImageFormat]:
     if len(data) < 4:
         return None
 
-    # Check PNG (8 bytes)
-    if data[:8] == b"\x89PNG\r\n\x1a\n":
-        return ImageFormat.PNG
+    # Each supported format has a distinct first byte, so dispatch on it
+    # and only compare the full signature for the one candidate.
+    first = data[0]
 
-    # Check JPEG (3 bytes)
-    if data[:3] == b"\xff\xd8\xff":
-        return ImageFormat.JPEG
+    if first == 0x89:  # PNG (8 bytes)
+        return ImageFormat.PNG if data.startswith(b"\x89PNG\r\n\x1a\n") else None
 
-    # Check WebP (requires checking RIFF header + WEBP)
-    if data[:4] == b"RIFF" and len(data) >= 12 and data[8:12] == b"WEBP":
-        return ImageFormat.WEBP
+    if first == 0xFF:  # JPEG (3 bytes)
+        return ImageFormat.JPEG if data.startswith(b"\xff\xd8\xff") else None
 
-    # Check GIF (6 bytes)
-    if data[:6] in (b"GIF87a", b"GIF89a"):
-        return ImageFormat.GIF
+    if first == 0x52:  # WebP ("RIFF" header + "WEBP")
+        if data.startswith(b"RIFF") and len(data) >= 12 and data[8:12] == b"WEBP":
+            return ImageFormat.WEBP
+        return None
+
+    if first == 0x47:  # GIF (6 bytes)
+        return ImageFormat.GIF if data.startswith((b"GIF87a", b"GIF89a")) else None
 
     return None
 
@@ -77,14 +93,5 @@ def format_from_extension(ext: str) -> Optional[ImageFormat]:
     Returns:
         ImageFormat or None if unknown
     """
-    ext = ext.lower().lstrip(".")
-
-    mapping = {
-        "png": ImageFormat.PNG,
-        "jpg": ImageFormat.JPEG,
-        "jpeg": ImageFormat.JPEG,
-        "webp": ImageFormat.WEBP,
-        "gif": ImageFormat.GIF,
-    }
+    return _EXT_MAP.get(ext.lower().lstrip("."))
 
-    return mapping.get(ext)
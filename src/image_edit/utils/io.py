@@ -1,15 +1,84 @@
 """Binary I/O helpers for stdin/stdout handling."""
 
+import os
 import sys
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 import click
-from PIL import Image
 
 from .image import detect_format, format_from_extension, ImageFormat
 
+# (stdin object, isatty() result) for the last stdin seen
+_STDIN_TTY_CACHE: Optional[tuple[Any, bool]] = None
+
+
+def _stdin_is_tty() -> bool:
+    """Return sys.stdin.isatty(), cached until sys.stdin is replaced."""
+    global _STDIN_TTY_CACHE
+    stdin = sys.stdin
+    if _STDIN_TTY_CACHE is None or _STDIN_TTY_CACHE[0] is not stdin:
+        _STDIN_TTY_CACHE = (stdin, stdin.isatty())
+    return _STDIN_TTY_CACHE[1]
+
+
+def _read_file_bytes(path: Path) -> bytes:
+    """Read a whole file with a single read sized from fstat()."""
+    # O_BINARY (Windows only) prevents CRT text-mode translation
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size) if size else b""
+        if size and len(data) == size:
+            return data
+
+        # Short read (very large files) or unknown size (special files):
+        # keep reading until EOF
+        chunks = [data]
+        while chunk := os.read(fd, 1 << 20):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _read_file(path: Path) -> tuple[bytes, Optional[ImageFormat]]:
+    """
+    Read an image file and detect its format.
+
+    Raises:
+        click.ClickException: If the file does not exist or is empty
+    """
+    if not path.exists():
+        raise click.ClickException(f"Input file not found: {path}")
+
+    data = _read_file_bytes(path)
+    if not data:
+        raise click.ClickException(f"Input file is empty: {path}")
+
+    # Try to detect format from content first, then extension
+    fmt = detect_format(data)
+    if fmt is None:
+        fmt = format_from_extension(path.suffix)
+
+    return data, fmt
+
+
+def _read_stdin_with_format() -> Optional[tuple[bytes, Optional[ImageFormat]]]:
+    """
+    Read all of stdin and detect its format.
+
+    Returns:
+        (data, detected format), or None if stdin is a TTY (nothing piped).
+        data may be empty if the pipe was closed without writing.
+    """
+    if _stdin_is_tty():
+        return None
+
+    data = click.get_binary_stream("stdin").read()
+    return data, detect_format(data)
+
 
 def read_multiple_images(
     input_paths: list[Path],
@@ -30,31 +99,13 @@ def read_multiple_images(
     Raises:
         click.ClickException: If input cannot be read or is empty
     """
-    images: list[tuple[bytes, Optional[ImageFormat]]] = []
-
-    # Read all specified input files
-    for path in input_paths:
-        if not path.exists():
-            raise click.ClickException(f"Input file not found: {path}")
-
-        data = path.read_bytes()
-        if not data:
-            raise click.ClickException(f"Input file is empty: {path}")
-
-        # Try to detect format from content first, then extension
-        fmt = detect_format(data)
-        if fmt is None:
-            fmt = format_from_extension(path.suffix)
-
-        images.append((data, fmt))
+    images = [_read_file(path) for path in input_paths]
 
     # If only one path and stdin has data, use stdin as additional image
-    if len(input_paths) == 1 and allow_stdin_fallback and not sys.stdin.isatty():
-        stdin = click.get_binary_stream("stdin")
-        stdin_data = stdin.read()
-        if stdin_data:
-            stdin_fmt = detect_format(stdin_data)
-            images.insert(0, (stdin_data, stdin_fmt))  # stdin image first
+    if len(input_paths) == 1 and allow_stdin_fallback:
+        stdin_entry = _read_stdin_with_format()
+        if stdin_entry is not None and stdin_entry[0]:
+            images = [stdin_entry, *images]  # stdin image first
 
     return images
 
@@ -75,36 +126,19 @@ def read_image_input(
         click.ClickException: If input cannot be read or is empty
     """
     if input_path is not None:
-        # Read from file
-        if not input_path.exists():
-            raise click.ClickException(f"Input file not found: {input_path}")
-
-        data = input_path.read_bytes()
-        if not data:
-            raise click.ClickException(f"Input file is empty: {input_path}")
-
-        # Try to detect format from content first, then extension
-        fmt = detect_format(data)
-        if fmt is None:
-            fmt = format_from_extension(input_path.suffix)
-
-        return data, fmt
+        return _read_file(input_path)
 
     # Read from stdin
-    stdin = click.get_binary_stream("stdin")
-
-    # Check if stdin is a TTY (no piped input)
-    if sys.stdin.isatty():
+    stdin_entry = _read_stdin_with_format()
+    if stdin_entry is None:
         raise click.ClickException(
             "No input provided. Use -i/--input for a file or pipe an image via stdin."
         )
 
-    data = stdin.read()
-    if not data:
+    if not stdin_entry[0]:
         raise click.ClickException("No data received from stdin.")
 
-    fmt = detect_format(data)
-    return data, fmt
+    return stdin_entry
 
 
 def write_image_output(
@@ -120,24 +154,21 @@ def write_image_output(
         output_path: Path to output file, or None to write to stdout
         output_format: Desired output format (for conversion if needed)
     """
-    if output_path is not None:
-        # Determine output format from path extension if not specified
-        if output_format is None:
+    # Files default to the extension's format; stdout defaults to PNG for consistency
+    if output_format is None:
+        if output_path is not None:
             output_format = format_from_extension(output_path.suffix)
+        else:
+            output_format = ImageFormat.PNG
 
-        # Convert format if needed
-        final_data = _convert_format(image_data, output_format)
+    # Pass-through (no conversion) returns image_data itself, so it is written
+    # without any intermediate copy
+    final_data = _convert_format(image_data, output_format)
 
-        # Write to file
+    if output_path is not None:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_bytes(final_data)
     else:
-        # Write to stdout - convert to PNG by default for consistency
-        if output_format is None:
-            output_format = ImageFormat.PNG
-
-        final_data = _convert_format(image_data, output_format)
-
         stdout = click.get_binary_stream("stdout")
         stdout.write(final_data)
 
@@ -166,14 +197,23 @@ def _convert_format(
         return image_data
 
     # Use PIL to convert
+    from PIL import Image
+
     img = Image.open(BytesIO(image_data))
 
-    # Handle RGBA to RGB conversion for JPEG
-    if target_format == ImageFormat.JPEG and img.mode == "RGBA":
-        # Create white background
-        background = Image.new("RGB", img.size, (255, 255, 255))
-        background.paste(img, mask=img.split()[3])  # Use alpha channel as mask
-        img = background
+    # JPEG has no alpha channel or palette: flatten to RGB
+    if target_format == ImageFormat.JPEG and img.mode in ("RGBA", "LA", "P"):
+        if img.mode == "P" and "transparency" in img.info:
+            img = img.convert("RGBA")
+
+        if img.mode in ("RGBA", "LA") and img.getchannel("A").getextrema()[0] < 255:
+            # Composite real transparency onto a white background
+            background = Image.new("RGB", img.size, (255, 255, 255))
+            background.paste(img.convert("RGB"), mask=img.getchannel("A"))
+            img = background
+        else:
+            # Fully opaque: a plain mode conversion is much cheaper
+            img = img.convert("RGB")
 
     output = BytesIO()
     pil_format = target_format.value.upper()
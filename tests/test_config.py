@@ -0,0 +1,104 @@
+"""Tests for configuration management."""
+
+import os
+
+import pytest
+
+from image_edit import config
+
+
+@pytest.fixture
+def config_home(tmp_path, monkeypatch):
+    """Point the config directory at a temporary home."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("GEMINI_MODEL", raising=False)
+    monkeypatch.setattr(config, "_CONFIG_CACHE", None)
+    monkeypatch.setattr(config, "_CONFIG_STAT", None)
+    config._reset_paths()
+    yield tmp_path
+    config._reset_paths()
+
+
+class TestConfigFile:
+    """Tests for reading and writing the config file."""
+
+    def test_missing_file_uses_default(self, config_home):
+        assert config.get_config_value("model") == config.DEFAULTS["model"]
+
+    def test_set_and_get(self, config_home):
+        config.set_config_value("model", "custom-model")
+        assert config.get_config_value("model") == "custom-model"
+
+    def test_unset(self, config_home):
+        config.set_config_value("model", "custom-model")
+        assert config.unset_config_value("model") is True
+        assert config.unset_config_value("model") is False
+        assert config.get_config_value("model") == config.DEFAULTS["model"]
+
+    def test_env_overrides_file(self, config_home, monkeypatch):
+        config.set_config_value("model", "file-model")
+        monkeypatch.setenv("GEMINI_MODEL", "env-model")
+        assert config.get_config_value("model") == "env-model"
+
+    def test_file_parsed_once(self, config_home, monkeypatch):
+        config.set_config_value("model", "custom-model")
+        monkeypatch.setattr(config, "_CONFIG_CACHE", None)
+
+        calls = []
+        real_load = config.tomllib.load
+
+        def counting_load(f):
+            calls.append(f)
+            return real_load(f)
+
+        monkeypatch.setattr(config.tomllib, "load", counting_load)
+        config.get_all_config()
+        assert len(calls) == 1
+
+    def test_external_edit_is_picked_up(self, config_home):
+        config.set_config_value("model", "custom-model")
+        config_file = config.get_config_file()
+        config_file.write_text('model = "edited-model"\n')
+        assert config.get_config_value("model") == "edited-model"
+
+    def test_edit_within_same_mtime_is_picked_up(self, config_home):
+        config.set_config_value("model", "custom-model")
+        config_file = config.get_config_file()
+        stat = config_file.stat()
+
+        # Simulate a rewrite within the filesystem's timestamp granularity
+        config_file.write_text('model = "edited-model-longer"\n')
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert config.get_config_value("model") == "edited-model-longer"
+
+    def test_save_leaves_no_temp_file(self, config_home):
+        config.set_config_value("model", "custom-model")
+        files = sorted(p.name for p in config.get_config_dir().iterdir())
+        assert files == ["config.toml"]
+
+    def test_save_preserves_mode(self, config_home):
+        config.set_config_value("model", "custom-model")
+        config_file = config.get_config_file()
+        config_file.chmod(0o640)
+
+        config.set_config_value("model", "other-model")
+        assert config_file.stat().st_mode & 0o777 == 0o640
+
+    def test_new_file_is_private(self, config_home):
+        config.set_config_value("api-key", "secret")
+        assert config.get_config_file().stat().st_mode & 0o777 == 0o600
+
+    def test_save_writes_through_symlink(self, config_home, tmp_path):
+        target = tmp_path / "dotfiles" / "config.toml"
+        target.parent.mkdir()
+        target.write_text('model = "linked-model"\n')
+        config_file = config.get_config_file()
+        config_file.symlink_to(target)
+
+        config.set_config_value("model", "custom-model")
+        assert config_file.is_symlink()
+        assert "custom-model" in target.read_text()
+
+    def test_unknown_key_raises(self, config_home):
+        with pytest.raises(ValueError, match="Unknown configuration key"):
+            config.set_config_value("bogus", "value")
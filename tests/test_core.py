@@ -1,8 +1,60 @@
 """Tests for core orchestration logic."""
 
+import asyncio
+
 import pytest
 
-from image_edit.core import resolve_prompt, get_provider
+from image_edit import config, core
+from image_edit.core import (
+    edit_image,
+    get_provider,
+    reset_provider_cache,
+    resolve_prompt,
+    run_combine,
+    run_edit,
+)
+from image_edit.providers import Provider, ProviderError
+from image_edit.providers.base import EditResult
+
+
+class StubProvider(Provider):
+    """Provider that records calls and checks it runs outside an event loop."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+
+    @property
+    def name(self) -> str:
+        return "stub"
+
+    @property
+    def is_configured(self) -> bool:
+        return True
+
+    def _result(self, *call) -> EditResult:
+        with pytest.raises(RuntimeError):
+            asyncio.get_running_loop()
+        self.calls.append(call)
+        return EditResult(image_data=b"result", mime_type="image/png", provider=self.name)
+
+    def edit(self, image_data, prompt, mime_type=None):
+        return self._result("edit", image_data, prompt, mime_type)
+
+    def generate(self, prompt):
+        return self._result("generate", prompt)
+
+    def combine(self, images, prompt):
+        return self._result("combine", images, prompt)
+
+
+@pytest.fixture
+def stub_provider(monkeypatch):
+    """Register a StubProvider under the name "stub"."""
+    provider = StubProvider()
+    monkeypatch.setitem(core._PROVIDERS, "stub", lambda: provider)
+    reset_provider_cache()
+    yield provider
+    reset_provider_cache()
 
 
 class TestResolvePrompt:
@@ -35,6 +87,84 @@ class TestGetProvider:
         provider = get_provider("gemini")
         assert provider.name == "gemini"
 
+    def test_provider_instance_is_cached(self):
+        assert get_provider("gemini") is get_provider("gemini")
+
+    def test_default_name_shares_cached_instance(self):
+        assert get_provider() is get_provider("gemini")
+
+    def test_reset_provider_cache(self):
+        provider = get_provider("gemini")
+        reset_provider_cache()
+        assert get_provider("gemini") is not provider
+
     def test_unknown_provider_raises(self):
         with pytest.raises(ValueError, match="Unknown provider"):
             get_provider("unknown")
+
+
+class TestProviderApiKey:
+    """Tests that API key changes reach the cached provider."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_config(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+        monkeypatch.setattr(config, "_CONFIG_CACHE", None)
+        monkeypatch.setattr(config, "_CONFIG_STAT", None)
+        config._reset_paths()
+        config.reload_settings()
+        reset_provider_cache()
+        yield
+        config._reset_paths()
+        config.reload_settings()
+        reset_provider_cache()
+
+    def test_env_key_set_after_first_lookup(self, monkeypatch):
+        provider = get_provider("gemini")
+        with pytest.raises(ProviderError, match="not configured"):
+            provider._get_client()
+
+        monkeypatch.setenv("GEMINI_API_KEY", "env-key")
+        assert get_provider("gemini")._get_client() is not None
+
+    def test_config_key_change_rebuilds_client(self):
+        config.set_config_value("api-key", "first-key")
+        first_client = get_provider("gemini")._get_client()
+        assert get_provider("gemini")._get_client() is first_client
+
+        config.set_config_value("api-key", "second-key")
+        assert get_provider("gemini")._get_client() is not first_client
+
+
+class TestRunEdit:
+    """Tests for the synchronous and async edit entry points."""
+
+    def test_run_edit_calls_provider_directly(self, stub_provider):
+        result = run_edit(b"image", "nobg", "stub", "image/png")
+
+        assert result.image_data == b"result"
+        assert stub_provider.calls == [
+            ("edit", b"image", resolve_prompt("nobg"), "image/png")
+        ]
+
+    async def test_edit_image_runs_in_thread(self, stub_provider):
+        result = await edit_image(b"image", "make it blue", "stub")
+
+        assert result.provider == "stub"
+        assert stub_provider.calls == [("edit", b"image", "make it blue", None)]
+
+
+class TestRunCombine:
+    """Tests for the combine entry point."""
+
+    def test_single_image_raises(self):
+        with pytest.raises(ValueError, match="At least 2 images"):
+            run_combine([(b"data", "image/png")], "combine")
+
+    def test_run_combine_calls_provider_directly(self, stub_provider):
+        images = [(b"one", "image/png"), (b"two", None)]
+        result = run_combine(images, "blend", "stub")
+
+        assert result.image_data == b"result"
+        assert stub_provider.calls == [("combine", images, "blend")]
@@ -1,8 +1,13 @@
 """Tests for the template system."""
 
+import threading
+import time
+
 import pytest
 
+from image_edit import config
 from image_edit.templates import Template, TemplateRegistry, BUILTIN_TEMPLATES
+from image_edit.templates import registry as registry_module
 
 
 class TestTemplate:
@@ -47,6 +52,38 @@ class TestTemplateRegistry:
         assert registry.get("t") is template
         assert registry.get("tst") is template
 
+    def test_override_rebinds_aliases(self):
+        registry = TemplateRegistry()
+        registry.register(Template(name="test", prompt="Old", aliases=["t"]))
+        replacement = Template(name="test", prompt="New")
+        registry.register(replacement)
+
+        assert registry.get("test") is replacement
+        assert registry.get("t") is replacement
+        assert registry.list_all() == [replacement]
+
+    def test_name_takes_precedence_over_alias(self):
+        registry = TemplateRegistry()
+        named = Template(name="t", prompt="Named")
+        registry.register(named)
+        registry.register(Template(name="test", prompt="Aliased", aliases=["t"]))
+
+        assert registry.get("t") is named
+
+    def test_contains(self):
+        registry = TemplateRegistry()
+        registry.register(Template(name="test", prompt="Test prompt", aliases=["t"]))
+
+        assert "test" in registry
+        assert "t" in registry
+        assert "make it blue" not in registry
+
+    def test_register_after_freeze_raises(self):
+        registry = TemplateRegistry()
+        registry.freeze()
+        with pytest.raises(RuntimeError, match="frozen"):
+            registry.register(Template(name="test", prompt="Test prompt"))
+
     def test_get_unknown_returns_none(self):
         registry = TemplateRegistry()
         assert registry.get("unknown") is None
@@ -63,6 +100,108 @@ class TestTemplateRegistry:
         assert t1 in all_templates
         assert t2 in all_templates
 
+    def test_iter_all_refreshed_after_register(self):
+        registry = TemplateRegistry()
+        t1 = Template(name="test1", prompt="Prompt 1")
+        registry.register(t1)
+        assert registry.iter_all() == (t1,)
+        assert registry.iter_all() is registry.iter_all()
+
+        t2 = Template(name="test2", prompt="Prompt 2")
+        registry.register(t2)
+        assert registry.iter_all() == (t1, t2)
+
+
+class TestUserTemplates:
+    """Tests for loading user templates from templates.toml."""
+
+    @pytest.fixture
+    def templates_file(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        config._reset_paths()
+        yield config.get_config_dir() / "templates.toml"
+        config._reset_paths()
+
+    def test_load_valid_templates(self, templates_file):
+        templates_file.write_text(
+            '[[template]]\n'
+            'name = "pop"\n'
+            'prompt = "Make the colors pop"\n'
+            'aliases = ["vivid"]\n'
+        )
+        registry = TemplateRegistry()
+        registry.load_user_templates()
+
+        assert registry.get("vivid").prompt == "Make the colors pop"
+
+    def test_invalid_entries_skipped(self, templates_file):
+        templates_file.write_text(
+            '[[template]]\n'
+            'name = "no-prompt"\n'
+            '\n'
+            '[[template]]\n'
+            'name = "bad-aliases"\n'
+            'prompt = "Prompt"\n'
+            'aliases = "oops"\n'
+            '\n'
+            '[[template]]\n'
+            'name = "good"\n'
+            'prompt = "Prompt"\n'
+        )
+        registry = TemplateRegistry()
+        registry.load_user_templates()
+
+        assert [t.name for t in registry.list_all()] == ["good"]
+
+    def test_malformed_file_ignored(self, templates_file):
+        templates_file.write_text("[[template]\nname = ")
+        registry = TemplateRegistry()
+        registry.load_user_templates()
+
+        assert registry.list_all() == []
+
+    def test_non_utf8_file_ignored(self, templates_file):
+        templates_file.write_bytes(b'x = "\xff\xfe"\n')
+        registry = TemplateRegistry()
+        registry.load_user_templates()
+
+        assert registry.list_all() == []
+
+
+class TestGetRegistry:
+    """Tests for the global registry accessor."""
+
+    def test_concurrent_first_call_loads_once(self, monkeypatch):
+        registry = TemplateRegistry()
+        loads = []
+
+        def slow_load():
+            loads.append(1)
+            time.sleep(0.05)
+            registry.register(Template(name="user", prompt="User prompt"))
+
+        monkeypatch.setattr(registry, "load_user_templates", slow_load)
+        monkeypatch.setattr(registry_module, "_registry", registry)
+        monkeypatch.setattr(registry_module, "_user_loaded", False)
+
+        errors = []
+
+        def worker():
+            try:
+                assert registry_module.get_registry() is registry
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert loads == [1]
+        assert "user" in registry
+
 
 class TestBuiltinTemplates:
     """Tests for built-in templates."""
@@ -1,12 +1,17 @@
 """Tests for utility functions."""
 
+from io import BytesIO
+
+import click
 import pytest
+from PIL import Image
 
 from image_edit.utils.image import (
     detect_format,
     format_from_extension,
     ImageFormat,
 )
+from image_edit.utils.io import read_image_input, write_image_output
 
 
 class TestDetectFormat:
@@ -39,6 +44,10 @@ class TestDetectFormat:
         data = b"\x00\x00\x00\x00" * 100
         assert detect_format(data) is None
 
+    def test_detect_riff_without_webp(self):
+        data = b"RIFF\x00\x00\x00\x00WAVE" + b"\x00" * 100
+        assert detect_format(data) is None
+
     def test_detect_too_short(self):
         data = b"\x89PN"
         assert detect_format(data) is None
@@ -82,3 +91,79 @@ class TestImageFormat:
         assert ImageFormat.JPEG.extension == ".jpg"
         assert ImageFormat.WEBP.extension == ".webp"
         assert ImageFormat.GIF.extension == ".gif"
+
+
+class TestWriteImageOutput:
+    """Tests for writing image output."""
+
+    def test_same_format_written_unchanged(self, tmp_path):
+        # Not a decodable PNG, so this only passes if PIL is never involved
+        data = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+        output = tmp_path / "out" / "result.png"
+        write_image_output(data, output)
+        assert output.read_bytes() == data
+
+    def test_mismatched_format_is_converted(self, tmp_path):
+        buffer = BytesIO()
+        Image.new("RGB", (4, 4), (255, 0, 0)).save(buffer, format="JPEG")
+        output = tmp_path / "result.png"
+        write_image_output(buffer.getvalue(), output)
+
+        assert detect_format(output.read_bytes()) == ImageFormat.PNG
+
+    @pytest.mark.parametrize(
+        "mode,color",
+        [("RGBA", (255, 0, 0, 255)), ("LA", (128, 255)), ("P", 1)],
+    )
+    def test_jpeg_from_mode_without_alpha_support(self, tmp_path, mode, color):
+        buffer = BytesIO()
+        Image.new(mode, (4, 4), color).save(buffer, format="PNG")
+        output = tmp_path / "result.jpg"
+        write_image_output(buffer.getvalue(), output)
+
+        with Image.open(output) as img:
+            assert img.format == "JPEG"
+            assert img.mode == "RGB"
+
+    def test_jpeg_composites_transparency_on_white(self, tmp_path):
+        buffer = BytesIO()
+        Image.new("RGBA", (4, 4), (0, 0, 0, 0)).save(buffer, format="PNG")
+        output = tmp_path / "result.jpg"
+        write_image_output(buffer.getvalue(), output)
+
+        with Image.open(output) as img:
+            assert all(channel > 250 for channel in img.getpixel((0, 0)))
+
+
+class TestReadImageInput:
+    """Tests for reading image input from files."""
+
+    def test_read_file(self, tmp_path):
+        data = b"\xff\xd8\xff\xe0" + b"\x00" * 100
+        path = tmp_path / "photo.bin"
+        path.write_bytes(data)
+        assert read_image_input(path) == (data, ImageFormat.JPEG)
+
+    def test_read_real_png_unchanged(self, tmp_path):
+        buffer = BytesIO()
+        Image.new("RGBA", (8, 8), (10, 13, 26, 128)).save(buffer, format="PNG")
+        data = buffer.getvalue()
+        path = tmp_path / "image.png"
+        path.write_bytes(data)
+
+        assert read_image_input(path) == (data, ImageFormat.PNG)
+
+    def test_format_falls_back_to_extension(self, tmp_path):
+        path = tmp_path / "photo.webp"
+        path.write_bytes(b"\x00" * 16)
+        assert read_image_input(path)[1] == ImageFormat.WEBP
+
+    def test_empty_file_raises(self, tmp_path):
+        path = tmp_path / "empty.png"
+        path.touch()
+        with pytest.raises(click.ClickException, match="empty"):
+            read_image_input(path)
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(click.ClickException, match="not found"):
+            read_image_input(tmp_path / "missing.png")